@@ -3,8 +3,11 @@ FastAPI ルート定義
 確率分布の計算とデータ提供API
 """
 
+import math
+
 from fastapi import APIRouter, HTTPException, Query
-from typing import Dict, List
+from fastapi.responses import ORJSONResponse
+from typing import Annotated, Dict, List
 from pydantic import BaseModel, Field, field_validator
 
 from models.distributions import (
@@ -14,6 +17,7 @@ from models.distributions import (
     get_available_distributions,
     get_distribution_info,
     calculate_distribution,
+    calculate_distribution_batch,
 )
 from utils.logger import setup_logger
 
@@ -21,6 +25,17 @@ logger = setup_logger()
 router = APIRouter()
 
 
+def check_parameter_values(parameters: Dict[str, float]) -> Dict[str, float]:
+    """パラメータの値が有効な数値であることを検証"""
+    for key, value in parameters.items():
+        if not isinstance(value, (int, float)):
+            raise ValueError(f"パラメータ {key} の値が数値ではありません: {value}")
+        # NaNやInfをチェック
+        if math.isnan(value) or math.isinf(value):
+            raise ValueError(f"パラメータ {key} の値が無効です（NaN/Inf）: {value}")
+    return parameters
+
+
 class CalculateRequest(BaseModel):
     """分布計算リクエスト"""
 
@@ -39,14 +54,31 @@ class CalculateRequest(BaseModel):
     @classmethod
     def validate_parameters(cls, v: Dict[str, float]) -> Dict[str, float]:
         """パラメータの値が有効な数値であることを検証"""
-        for key, value in v.items():
-            if not isinstance(value, (int, float)):
-                raise ValueError(f"パラメータ {key} の値が数値ではありません: {value}")
-            # NaNやInfをチェック
-            import math
-
-            if math.isnan(value) or math.isinf(value):
-                raise ValueError(f"パラメータ {key} の値が無効です（NaN/Inf）: {value}")
+        return check_parameter_values(v)
+
+
+class BatchCalculateRequest(BaseModel):
+    """複数パラメータの一括計算リクエスト（比較表示用）"""
+
+    distribution_type: DistributionType = Field(..., description="分布の種類")
+    parameter_sets: List[
+        Annotated[Dict[str, float], Field(min_length=1, max_length=20)]
+    ] = Field(..., min_length=1, max_length=20, description="パラメータの辞書のリスト")
+    num_points: int = Field(
+        default=1000,
+        ge=10,
+        le=10000,
+        description="グラフのデータポイント数（10〜10000）",
+    )
+
+    @field_validator("parameter_sets")
+    @classmethod
+    def validate_parameter_sets(
+        cls, v: List[Dict[str, float]]
+    ) -> List[Dict[str, float]]:
+        """各パラメータの辞書の値が有効な数値であることを検証"""
+        for parameters in v:
+            check_parameter_values(parameters)
         return v
 
 
@@ -111,7 +143,48 @@ async def calculate(request: CalculateRequest):
             num_points=request.num_points,
         )
         logger.info("Calculation successful")
-        return data
+        # 配列を ndarray のまま orjson でシリアライズする
+        # （response_model による再検証と list への変換を省略）
+        return ORJSONResponse(content=data.model_dump())
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/calculate/batch", response_model=List[DistributionData])
+async def calculate_batch(request: BatchCalculateRequest):
+    """
+    同じ分布を複数のパラメータでまとめて計算
+
+    Args:
+        request: 一括計算リクエスト（分布タイプ、パラメータのリスト）
+
+    Returns:
+        List[DistributionData]: パラメータのリストと同じ順序のグラフ描画用データ
+
+    Raises:
+        HTTPException: バリデーションエラーまたは計算エラー
+    """
+    logger.info(
+        f"Calculating distribution batch: {request.distribution_type} "
+        f"with {len(request.parameter_sets)} parameter sets, "
+        f"num_points: {request.num_points}"
+    )
+
+    try:
+        for parameters in request.parameter_sets:
+            validate_distribution_parameters(request.distribution_type, parameters)
+
+        data = calculate_distribution_batch(
+            dist_type=request.distribution_type,
+            parameter_sets=request.parameter_sets,
+            num_points=request.num_points,
+        )
+        logger.info("Batch calculation successful")
+        return ORJSONResponse(content=[d.model_dump() for d in data])
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -87,6 +87,52 @@ def calculate_distribution(
     raise NotImplementedError(f"Distribution {dist_type} not implemented")
 
 
+def calculate_distribution_batch(
+    dist_type: DistributionType,
+    parameter_sets: List[Dict[str, float]],
+    num_points: int = 1000,
+) -> List[DistributionData]:
+    """
+    同じ分布を複数のパラメータでまとめて計算（比較表示用）
+
+    確率分布は各パラメータの組ごとに calculate() と同じ x グリッドを持ち、
+    (K, N) の配列として一度にブロードキャストで計算する。
+
+    Args:
+        dist_type: 分布の種類
+        parameter_sets: パラメータの辞書のリスト
+        num_points: グラフのデータポイント数
+
+    Returns:
+        List[DistributionData]: parameter_sets と同じ順序のグラフ描画用データ
+    """
+    if dist_type not in DISTRIBUTION_REGISTRY:
+        raise ValueError(f"Unknown distribution type: {dist_type}")
+
+    dist_class = DISTRIBUTION_REGISTRY[dist_type]
+
+    # 一様分布の場合
+    if dist_type == DistributionType.UNIFORM:
+        return dist_class.calculate_batch(
+            a=[p.get("a", 0.0) for p in parameter_sets],
+            b=[p.get("b", 1.0) for p in parameter_sets],
+            num_points=num_points,
+        )
+
+    # 指数分布の場合
+    if dist_type == DistributionType.EXPONENTIAL:
+        return dist_class.calculate_batch(
+            lambdas=[p.get("lambda_", 1.0) for p in parameter_sets],
+            num_points=num_points,
+        )
+
+    # 単回帰分析はデータ生成が乱数に依存するため、個別に計算する
+    return [
+        calculate_distribution(dist_type, parameters, num_points)
+        for parameters in parameter_sets
+    ]
+
+
 # 公開API
 __all__ = [
     # 型定義
@@ -104,4 +150,5 @@ __all__ = [
     "get_available_distributions",
     "get_distribution_info",
     "calculate_distribution",
+    "calculate_distribution_batch",
 ]
@@ -0,0 +1,29 @@
+"""
+計算用の作業バッファ
+スレッドごとに float64 の配列を確保して使い回し、リクエストごとのメモリ確保を避ける
+"""
+
+import threading
+
+import numpy as np
+
+_SCRATCH = threading.local()
+
+
+def get_scratch(n: int) -> np.ndarray:
+    """
+    x, pdf, cdf 用の作業バッファを取得
+
+    同じスレッドからの次の呼び出しで上書きされるため、結果はコピーしてから返すこと。
+
+    Args:
+        n: 各配列の長さ
+
+    Returns:
+        np.ndarray: 形状 (3, n) の float64 配列（各行は連続したメモリ）
+    """
+    buf = getattr(_SCRATCH, "buf", None)
+    if buf is None or buf.shape[1] < n:
+        buf = np.empty((3, n))
+        _SCRATCH.buf = buf
+    return buf[:, :n]
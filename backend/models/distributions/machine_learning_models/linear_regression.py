@@ -9,6 +9,46 @@ from ..base import (
 )
 
 
+_INFO = DistributionInfo(
+    type=DistributionType.LINEAR_REGRESSION,
+    name="単回帰分析",
+    description="単回帰分析のシミュレーション。パラメータを変更して、回帰直線がどのように変化するか確認できます。",
+    category=CategoryType.ML_REGRESSION,
+    tags=["回帰分析", "機械学習", "統計"],
+    formula_pdf=r"y = ax + b + \epsilon, \quad \epsilon \sim N(0, \sigma^2)",
+    parameters=[
+        DistributionParameter(
+            name="slope",
+            label="傾き (a)",
+            description="真の回帰直線の傾き（データ生成用）",
+            default_value=1.0,
+            min_value=-5.0,
+            max_value=5.0,
+            step=0.1,
+        ),
+        # intercept は固定のため削除
+        DistributionParameter(
+            name="noise_std",
+            label="ノイズ (σ)",
+            description="観測データに含まれるノイズの標準偏差",
+            default_value=1.0,
+            min_value=0.1,
+            max_value=5.0,
+            step=0.1,
+        ),
+        DistributionParameter(
+            name="pattern_id",
+            label="データタイプ",
+            description="0:線形, 1:二次関数, 2:外れ値",
+            default_value=0.0,
+            min_value=0.0,
+            max_value=2.0,
+            step=1.0,
+        ),
+    ],
+)
+
+
 class LinearRegression:
 
     @staticmethod
@@ -16,44 +56,7 @@ class LinearRegression:
         """
         単回帰モデルの情報を取得
         """
-        return DistributionInfo(
-            type=DistributionType.LINEAR_REGRESSION,
-            name="単回帰分析",
-            description="単回帰分析のシミュレーション。パラメータを変更して、回帰直線がどのように変化するか確認できます。",
-            category=CategoryType.ML_REGRESSION,
-            tags=["回帰分析", "機械学習", "統計"],
-            formula_pdf=r"y = ax + b + \epsilon, \quad \epsilon \sim N(0, \sigma^2)",
-            parameters=[
-                DistributionParameter(
-                    name="slope",
-                    label="傾き (a)",
-                    description="真の回帰直線の傾き（データ生成用）",
-                    default_value=1.0,
-                    min_value=-5.0,
-                    max_value=5.0,
-                    step=0.1,
-                ),
-                # intercept は固定のため削除
-                DistributionParameter(
-                    name="noise_std",
-                    label="ノイズ (σ)",
-                    description="観測データに含まれるノイズの標準偏差",
-                    default_value=1.0,
-                    min_value=0.1,
-                    max_value=5.0,
-                    step=0.1,
-                ),
-                DistributionParameter(
-                    name="pattern_id",
-                    label="データタイプ",
-                    description="0:線形, 1:二次関数, 2:外れ値",
-                    default_value=0.0,
-                    min_value=0.0,
-                    max_value=2.0,
-                    step=1.0,
-                ),
-            ],
-        )
+        return _INFO
 
     @staticmethod
     def calculate(
@@ -132,11 +135,11 @@ class LinearRegression:
         var_y = float(np.var(y_observed))
         std_y = float(np.std(y_observed))
 
-        return DistributionData(
-            x_values=x.tolist(),
-            y_true=y_true.tolist(),
-            y_observed=y_observed.tolist(),
-            y_fitted=y_fitted.tolist(),
+        return DistributionData.from_trusted(
+            x_values=x,
+            y_true=y_true,
+            y_observed=y_observed,
+            y_fitted=y_fitted,
             mean=mean_y,
             variance=var_y,
             std_dev=std_y,
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import List, Sequence
+
 import numpy as np
 
 from .base import (
@@ -7,16 +10,19 @@ from .base import (
     DistributionInfo,
     DistributionData,
 )
+from ._scratch import get_scratch
 
+try:
+    # ビルド済みの Cython 拡張があれば優先して使う
+    from ._kernels import uniform_fill
+except ImportError:
+    from ._jit import uniform_fill
 
-class UniformDistribution:
 
-    @staticmethod
-    def get_info() -> DistributionInfo:
-        return DistributionInfo(
-            type=DistributionType.UNIFORM,
-            name="一様分布",
-            description="""一様分布は「ある範囲の中では、どの値もまったく同じ確率で出現する」という性質を持つ分布です。
+_INFO = DistributionInfo(
+    type=DistributionType.UNIFORM,
+    name="一様分布",
+    description="""一様分布は「ある範囲の中では、どの値もまったく同じ確率で出現する」という性質を持つ分布です。
 イメージは「完全に平らな山」です。高さは一定で、どの位置も同じだけ選ばれやすい。
 
 ■ 性質
@@ -27,53 +33,109 @@ class UniformDistribution:
 1. 最も何も情報を持たない分布（最大エントロピー分布）
    区間が決まっていて、期待値や分散など制約がなければ「最も無知（＝公平）」な分布は一様分布になります。
 2. 「乱数の基準」として世界共通""",
-            category=CategoryType.CONTINUOUS,
-            tags=["基本", "連続", "一様", "等確率"],
-            formula_pdf=r"f(x) = \begin{cases} \frac{1}{b-a} & \text{if } a \leq x \leq b \\ 0 & \text{otherwise} \end{cases}",
-            formula_cdf=r"F(x) = \begin{cases} 0 & \text{if } x < a \\ \frac{x-a}{b-a} & \text{if } a \leq x \leq b \\ 1 & \text{if } x > b \end{cases}",
-            parameters=[
-                DistributionParameter(
-                    name="a",
-                    label="下限 (a)",
-                    description="分布の下限値。この値以上で一様に分布します。",
-                    default_value=0.0,
-                    min_value=-10.0,
-                    max_value=10.0,
-                    step=0.1,
-                ),
-                DistributionParameter(
-                    name="b",
-                    label="上限 (b)",
-                    description="分布の上限値。この値以下で一様に分布します。",
-                    default_value=1.0,
-                    min_value=-10.0,
-                    max_value=10.0,
-                    step=0.1,
-                ),
-            ],
-        )
+    category=CategoryType.CONTINUOUS,
+    tags=["基本", "連続", "一様", "等確率"],
+    formula_pdf=r"f(x) = \begin{cases} \frac{1}{b-a} & \text{if } a \leq x \leq b \\ 0 & \text{otherwise} \end{cases}",
+    formula_cdf=r"F(x) = \begin{cases} 0 & \text{if } x < a \\ \frac{x-a}{b-a} & \text{if } a \leq x \leq b \\ 1 & \text{if } x > b \end{cases}",
+    parameters=[
+        DistributionParameter(
+            name="a",
+            label="下限 (a)",
+            description="分布の下限値。この値以上で一様に分布します。",
+            default_value=0.0,
+            min_value=-10.0,
+            max_value=10.0,
+            step=0.1,
+        ),
+        DistributionParameter(
+            name="b",
+            label="上限 (b)",
+            description="分布の上限値。この値以下で一様に分布します。",
+            default_value=1.0,
+            min_value=-10.0,
+            max_value=10.0,
+            step=0.1,
+        ),
+    ],
+)
+
+
+@lru_cache(maxsize=256)
+def _calc_uniform(a: float, b: float, num_points: int) -> DistributionData:
+    """一様分布の計算結果をパラメータごとにキャッシュ"""
+    margin = (b - a) * 0.2
+    x, pdf, cdf = get_scratch(num_points)
+    uniform_fill(a, b, a - margin, b + margin, x, pdf, cdf)
+
+    mean = (a + b) / 2.0
+    variance = ((b - a) ** 2) / 12.0
+    std_dev = np.sqrt(variance)
+
+    return DistributionData.from_trusted(
+        as_float32=True,
+        x_values=x,
+        pdf_values=pdf,
+        cdf_values=cdf,
+        mean=float(mean),
+        variance=float(variance),
+        std_dev=float(std_dev),
+    )
+
+
+class UniformDistribution:
+
+    @staticmethod
+    def get_info() -> DistributionInfo:
+        return _INFO
 
     @staticmethod
     def calculate(a: float, b: float, num_points: int = 1000) -> DistributionData:
         if a >= b:
             raise ValueError("aはbより小さくなければなりません")
 
-        margin = (b - a) * 0.2
-        x = np.linspace(a - margin, b + margin, num_points)
+        # キャッシュされたモデルは共有されるため、浅いコピーを返す
+        return _calc_uniform(float(a), float(b), int(num_points)).model_copy()
 
-        pdf = np.where((x >= a) & (x <= b), 1.0 / (b - a), 0.0)
+    @staticmethod
+    def calculate_batch(
+        a: Sequence[float], b: Sequence[float], num_points: int = 1000
+    ) -> List[DistributionData]:
+        """
+        複数の (a, b) をまとめて計算（比較表示用）
+
+        各曲線は calculate() と同じく、区間 [a, b] の前後に 20% の余白を取った x グリッドを持つ。
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        if a.ndim != 1 or a.size == 0 or a.shape != b.shape:
+            raise ValueError("aとbは同じ長さの1次元の列でなければなりません")
+        if (a >= b).any():
+            raise ValueError("aはbより小さくなければなりません")
+
+        # 行ごとに区間を取った (K, N) のグリッドで一度に評価する
+        margin = (b - a) * 0.2
+        lo, hi = a - margin, b + margin
+        t = np.linspace(0.0, 1.0, num_points)
+        x = lo[:, None] + np.multiply.outer(hi - lo, t)
 
-        cdf = np.clip((x - a) / (b - a), 0.0, 1.0)
+        inv_ba = (1.0 / (b - a))[:, None]
+        u = (x - a[:, None]) * inv_ba
+        cdf = np.clip(u, 0.0, 1.0)
+        pdf = (u == cdf) * inv_ba
 
         mean = (a + b) / 2.0
         variance = ((b - a) ** 2) / 12.0
         std_dev = np.sqrt(variance)
 
-        return DistributionData(
-            x_values=x.tolist(),
-            pdf_values=pdf.tolist(),
-            cdf_values=cdf.tolist(),
-            mean=float(mean),
-            variance=float(variance),
-            std_dev=float(std_dev),
-        )
+        return [
+            DistributionData.from_trusted(
+                as_float32=True,
+                x_values=x[k],
+                pdf_values=pdf[k],
+                cdf_values=cdf[k],
+                mean=float(mean[k]),
+                variance=float(variance[k]),
+                std_dev=float(std_dev[k]),
+            )
+            for k in range(a.size)
+        ]
@@ -1,4 +0,0 @@
-"""
-機械学習モデルモジュール
-回帰、分類、クラスタリングなどの機械学習モデルを実装
-"""
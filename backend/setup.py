@@ -0,0 +1,27 @@
+"""
+Cython 拡張のビルド設定
+本番サーバー向けに確率分布カーネルを事前コンパイルする（任意）
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+拡張がビルドされていない場合は Numba / NumPy 実装が使われる
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+extensions = [
+    Extension(
+        "models.distributions._kernels",
+        ["models/distributions/_kernels.pyx"],
+        extra_compile_args=["-O3", "-march=native", "-ffast-math"],
+        # -ffast-math で生成されるベクトル版 exp 系関数（libmvec）をリンクする
+        libraries=["m"],
+    ),
+]
+
+setup(
+    name="probability-distribution-kernels",
+    ext_modules=cythonize(extensions, language_level=3),
+)
@@ -0,0 +1,109 @@
+"""
+一括計算（calculate_batch / POST /api/v1/calculate/batch）のテスト
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.distributions import (
+    DistributionType,
+    ExponentialDistribution,
+    UniformDistribution,
+    calculate_distribution_batch,
+)
+
+
+FIELDS = ["x_values", "pdf_values", "cdf_values", "mean", "variance", "std_dev"]
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app)
+
+
+def assert_same(batch_row, single):
+    for name in FIELDS:
+        np.testing.assert_array_equal(
+            getattr(batch_row, name), getattr(single, name), err_msg=name
+        )
+
+
+@pytest.mark.parametrize("num_points", [10, 1000])
+def test_expon_batch_matches_calculate(num_points):
+    lambdas = [0.1, 1.0, 7.3, 10.0]
+    rows = ExponentialDistribution.calculate_batch(lambdas, num_points)
+    assert len(rows) == len(lambdas)
+    for row, lam in zip(rows, lambdas):
+        assert_same(row, ExponentialDistribution.calculate(lam, num_points))
+
+
+@pytest.mark.parametrize("num_points", [10, 1000])
+def test_uniform_batch_matches_calculate(num_points):
+    params = [(0.0, 1.0), (-10.0, 10.0), (0.0, 0.1), (-3.5, 2.2)]
+    rows = UniformDistribution.calculate_batch(
+        [a for a, _ in params], [b for _, b in params], num_points
+    )
+    assert len(rows) == len(params)
+    for row, (a, b) in zip(rows, params):
+        assert_same(row, UniformDistribution.calculate(a, b, num_points))
+
+
+def test_uniform_batch_narrow_next_to_wide():
+    # 幅の異なる区間を並べても、狭い区間の密度が潰れないこと
+    narrow, wide = calculate_distribution_batch(
+        DistributionType.UNIFORM, [{"a": 0.0, "b": 0.1}, {"a": -10.0, "b": 10.0}]
+    )
+    inside = (narrow.x_values >= 0.0) & (narrow.x_values <= 0.1)
+    assert inside.sum() > 0
+    np.testing.assert_allclose(narrow.pdf_values[inside], 10.0, rtol=1e-6)
+    assert narrow.x_values[-1] == pytest.approx(0.12)
+    assert wide.x_values[-1] == pytest.approx(14.0)
+
+
+def test_batch_endpoint_matches_calculate_endpoint(client):
+    parameter_sets = [{"lambda_": 0.5}, {"lambda_": 2.0}]
+    r = client.post(
+        "/api/v1/calculate/batch",
+        json={
+            "distribution_type": "exponential",
+            "parameter_sets": parameter_sets,
+            "num_points": 200,
+        },
+    )
+    assert r.status_code == 200, r.text
+    rows = r.json()
+    assert len(rows) == len(parameter_sets)
+    for row, parameters in zip(rows, parameter_sets):
+        single = client.post(
+            "/api/v1/calculate",
+            json={
+                "distribution_type": "exponential",
+                "parameters": parameters,
+                "num_points": 200,
+            },
+        )
+        assert single.status_code == 200, single.text
+        assert row == single.json()
+
+
+@pytest.mark.parametrize("parameter_sets", [[], [{}], [{"a": 0.0, "b": 1.0}, {}]])
+def test_batch_endpoint_rejects_empty(client, parameter_sets):
+    r = client.post(
+        "/api/v1/calculate/batch",
+        json={"distribution_type": "uniform", "parameter_sets": parameter_sets},
+    )
+    assert r.status_code == 422, r.text
+
+
+def test_batch_endpoint_rejects_out_of_range(client):
+    r = client.post(
+        "/api/v1/calculate/batch",
+        json={
+            "distribution_type": "exponential",
+            "parameter_sets": [{"lambda_": 1.0}, {"lambda_": 100.0}],
+        },
+    )
+    assert r.status_code == 400, r.text
+    assert "範囲外" in r.json()["detail"]
@@ -0,0 +1,38 @@
+"""
+calculate() の結果キャッシュのテスト
+キャッシュされたモデルが呼び出し側の変更で壊れないことを確認する
+"""
+
+import numpy as np
+import pytest
+
+from models.distributions import ExponentialDistribution, UniformDistribution
+
+
+CASES = [
+    pytest.param(lambda: ExponentialDistribution.calculate(1.5, 100), id="exponential"),
+    pytest.param(lambda: UniformDistribution.calculate(-1.0, 2.0, 100), id="uniform"),
+]
+
+
+@pytest.mark.parametrize("calc", CASES)
+def test_calculate_returns_separate_models(calc):
+    first = calc()
+    second = calc()
+    assert first is not second
+
+    # 返されたモデルの属性を差し替えても、次の呼び出しには影響しない
+    first.mean = -1.0
+    first.x_values = np.zeros(100)
+    third = calc()
+    assert third.mean == second.mean
+    np.testing.assert_array_equal(third.x_values, second.x_values)
+
+
+@pytest.mark.parametrize("calc", CASES)
+@pytest.mark.parametrize("name", ["x_values", "pdf_values", "cdf_values"])
+def test_cached_arrays_are_read_only(calc, name):
+    arr = getattr(calc(), name)
+    with pytest.raises(ValueError):
+        arr[0] = 123.0
+    assert getattr(calc(), name)[0] != 123.0
@@ -0,0 +1,94 @@
+"""
+計算カーネルの実装間の整合性テスト
+NumPy / Numba / Cython の各実装を閉形式の NumPy 計算と比較する
+（インストール・ビルドされていない実装はスキップ）
+"""
+
+import numpy as np
+import pytest
+
+from models.distributions import _jit
+
+try:
+    from models.distributions import _kernels
+except ImportError:
+    _kernels = None
+
+
+BACKENDS = [
+    pytest.param(
+        (_jit.expon_fill_numpy, _jit.uniform_fill_numpy), id="numpy"
+    ),
+    pytest.param(
+        (_jit.expon_fill, _jit.uniform_fill),
+        id="numba",
+        marks=pytest.mark.skipif(
+            not _jit.NUMBA_AVAILABLE, reason="numba がインストールされていません"
+        ),
+    ),
+    pytest.param(
+        (
+            getattr(_kernels, "expon_fill", None),
+            getattr(_kernels, "uniform_fill", None),
+        ),
+        id="cython",
+        marks=pytest.mark.skipif(
+            _kernels is None, reason="Cython 拡張がビルドされていません"
+        ),
+    ),
+]
+
+
+def _buffers(n):
+    return np.empty(n), np.empty(n), np.empty(n)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("lam", [0.1, 1.0, 7.3])
+# 並列カーネルに切り替わる点数も含める
+@pytest.mark.parametrize("n", [10, 1000, _jit.PARALLEL_THRESHOLD + 1])
+def test_expon_fill_matches_closed_form(backend, lam, n):
+    expon_fill, _ = backend
+    x_max = 5.0 / lam
+    x, pdf, cdf = _buffers(n)
+    expon_fill(lam, x_max, x, pdf, cdf)
+
+    x_ref = np.linspace(0.0, x_max, n)
+    np.testing.assert_allclose(x, x_ref, rtol=1e-12, atol=1e-15)
+    assert x[0] == 0.0
+    assert x[n - 1] == x_max
+    np.testing.assert_allclose(pdf, lam * np.exp(-lam * x_ref), rtol=1e-12)
+    np.testing.assert_allclose(cdf, -np.expm1(-lam * x_ref), rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("a, b", [(0.0, 1.0), (-10.0, 10.0), (2.5, 2.6)])
+@pytest.mark.parametrize("n", [10, 1001])
+def test_uniform_fill_matches_closed_form(backend, a, b, n):
+    _, uniform_fill = backend
+    margin = (b - a) * 0.2
+    lo, hi = a - margin, b + margin
+    x, pdf, cdf = _buffers(n)
+    uniform_fill(a, b, lo, hi, x, pdf, cdf)
+
+    x_ref = np.linspace(lo, hi, n)
+    np.testing.assert_allclose(x, x_ref, rtol=1e-12, atol=1e-12)
+    assert x[n - 1] == hi
+    # 区間の端に丸め誤差で乗る点は判定がずれうるので、x 自体から期待値を求める
+    inside = (x >= a) & (x <= b)
+    np.testing.assert_allclose(pdf, np.where(inside, 1.0 / (b - a), 0.0), rtol=1e-12)
+    np.testing.assert_allclose(
+        cdf, np.clip((x - a) / (b - a), 0.0, 1.0), rtol=1e-12, atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_uniform_fill_includes_both_endpoints(backend):
+    _, uniform_fill = backend
+    # グリッドが a = 0 と b = 1 にちょうど乗るように取る
+    x, pdf, cdf = _buffers(5)
+    uniform_fill(0.0, 1.0, -0.5, 1.5, x, pdf, cdf)
+
+    np.testing.assert_array_equal(x, [-0.5, 0.0, 0.5, 1.0, 1.5])
+    np.testing.assert_array_equal(pdf, [0.0, 1.0, 1.0, 1.0, 0.0])
+    np.testing.assert_array_equal(cdf, [0.0, 0.0, 0.5, 1.0, 1.0])
@@ -0,0 +1,76 @@
+"""
+DistributionData の配列フィールド（FloatArray）の検証とシリアライズのテスト
+"""
+
+import json
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from models.distributions import DistributionData
+
+
+def make(**overrides):
+    n = overrides.pop("n", 10)
+    values = {
+        "x_values": np.linspace(0.0, 1.0, n),
+        "pdf_values": np.ones(n),
+        "cdf_values": np.linspace(0.0, 1.0, n),
+        "mean": 0.5,
+        "variance": 1.0 / 12.0,
+        "std_dev": 0.29,
+    }
+    values.update(overrides)
+    return DistributionData(**values)
+
+
+@pytest.mark.parametrize("n", [10, 10000])
+def test_accepts_length_bounds(n):
+    assert len(make(n=n).x_values) == n
+
+
+@pytest.mark.parametrize("n", [9, 10001])
+def test_rejects_length_out_of_bounds(n):
+    with pytest.raises(ValidationError, match="要素数"):
+        make(n=n)
+
+
+def test_rejects_2d():
+    with pytest.raises(ValidationError, match="1次元"):
+        make(x_values=np.zeros((2, 10)))
+
+
+def test_rejects_non_numeric():
+    with pytest.raises(ValidationError, match="数値の配列"):
+        make(x_values=["a"] * 10)
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf])
+def test_rejects_nan_inf(bad):
+    pdf = np.ones(10)
+    pdf[3] = bad
+    with pytest.raises(ValidationError, match="NaNまたはInf"):
+        make(pdf_values=pdf)
+
+
+def test_list_input_becomes_float64():
+    data = make(x_values=list(range(10)))
+    assert isinstance(data.x_values, np.ndarray)
+    assert data.x_values.dtype == np.float64
+
+
+def test_keeps_float32():
+    data = make(pdf_values=np.ones(10, dtype=np.float32))
+    assert data.pdf_values.dtype == np.float32
+
+
+def test_dump_keeps_ndarray_and_json_uses_lists():
+    data = make()
+    dumped = data.model_dump()
+    assert isinstance(dumped["x_values"], np.ndarray)
+    assert dumped["y_true"] is None
+
+    loaded = json.loads(data.model_dump_json())
+    assert loaded["x_values"] == data.x_values.tolist()
+    assert loaded["pdf_values"] == [1.0] * 10